@@ -1,12 +1,131 @@
+import asyncio
+import csv
+import io
+import os
 import sqlite3
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional, feeds are then fetched with a thread pool
+    aiohttp = None
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-from bs4 import BeautifulSoup
-from langdetect import detect
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # pyarrow is optional, CSVs are then written with the csv module
+    pa = None
+from lxml import etree
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional, clean_summary falls back to a regex
+    LexborHTMLParser = None
+try:
+    import fasttext
+except ImportError:  # fasttext is optional, languages are then detected with langdetect
+    fasttext = None
+from langdetect import DetectorFactory, detector_factory
+from langdetect.lang_detect_exception import LangDetectException
 import html
+import re
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# Matches any HTML tag; used to strip summaries when selectolax is not installed
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Runs of whitespace, collapsed to a single space in a single C-level scan
+_WS_RE = re.compile(r"\s+")
+
+# Threads used to fetch feeds when aiohttp is not installed
+FETCH_WORKERS = 16
+
+# Feeds larger than this are skipped instead of being buffered whole
+MAX_FEED_BYTES = 2_000_000
+
+# Columns of a parsed article, in the order they are written out
+ARTICLE_COLUMNS = ["Title", "Summary", "Published", "Link", "Source", "Country", "Language"]
+
+# PRAGMAs applied once per SQLite connection to speed up batch inserts
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Languages published by the configured feeds; only these langdetect profiles are loaded
+DETECT_LANGUAGES = (
+    "en", "fr", "de", "it", "es", "pt", "ru", "ja",
+    "zh-cn", "zh-tw", "ko", "hi", "bn", "ne", "id",
+    "vi", "th", "tl", "tr", "ar",
+)
+
+def _load_lang_factory(languages):
+    """Build a langdetect factory holding only the given language profiles"""
+    profiles = []
+    for lang in languages:
+        with open(os.path.join(detector_factory.PROFILES_DIRECTORY, lang), encoding="utf-8") as fh:
+            profiles.append(fh.read())
+    factory = DetectorFactory()
+    factory.load_json_profile(profiles)
+    return factory
+
+# fasttext's compressed language-ID model, used instead of langdetect when fasttext
+# is installed and the file is present (download lid.176.ftz from fasttext.cc and
+# put it next to this script, or point FASTTEXT_LID_MODEL at it)
+FASTTEXT_MODEL = os.environ.get(
+    "FASTTEXT_LID_MODEL", os.path.join(os.path.dirname(os.path.abspath(__file__)), "lid.176.ftz")
+)
+
+def _load_fasttext(path):
+    """Load the fasttext language-ID model, or return None if it is unavailable or unusable"""
+    if fasttext is None or not os.path.exists(path):
+        return None
+    model = fasttext.load_model(path)
+    # Some fasttext/NumPy combinations load the model but fail on every predict;
+    # check once here and fall back to langdetect instead of mislabelling every article
+    try:
+        model.predict("language check", k=1)
+    except ValueError as e:
+        print(f"fasttext model {path} is unusable, falling back to langdetect: {e}")
+        return None
+    return model
+
+_LID = _load_fasttext(FASTTEXT_MODEL)
+_FASTTEXT_CODES = {"zh": "zh-cn"}  # Keep langdetect's code for Chinese
+
+DetectorFactory.seed = 0  # Deterministic language detection
+_LANG_FACTORY = None if _LID is not None else _load_lang_factory(DETECT_LANGUAGES)
+
+# Once this many detections for a source agree, its language is reused without detecting
+LANG_MODE_SAMPLES = 5
+
+@lru_cache(maxsize=4096)
+def _detect_cached(text):
+    """Detect the language of a text, memoized since feeds often repeat lead sentences"""
+    if _LID is not None:
+        labels, _ = _LID.predict(text.replace("\n", " "), k=1)
+        code = labels[0].replace("__label__", "")
+        return _FASTTEXT_CODES.get(code, code)
+    try:
+        detector = _LANG_FACTORY.create()
+        detector.append(text)
+        return detector.detect()
+    except LangDetectException:  # Raised when the text has no usable features
+        return "unknown"
+
 class NewsScraper:
+    # Search paths for each article field, in order of preference; "{*}" matches any
+    # namespace. Built once here, since lxml caches the compiled form of each path
+    _TITLE_PATHS = (".//{*}title",)
+    _SUMMARY_PATHS = (".//{*}description", ".//{*}summary", ".//{*}content")
+    _PUB_DATE_PATHS = (".//{*}pubDate", ".//{*}updated")
+    _LINK_PATHS = (".//{*}link",)
+
     def __init__(self, rss_feeds):
         # Initialize with list of RSS feeds
         self.rss_feeds = rss_feeds
@@ -14,14 +133,44 @@ class NewsScraper:
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                 "(KHTML, like Gecko) Chrome/122.0 Safari/537.36"
-            )
+            ),
+            "Accept-Encoding": "gzip, deflate",  # XML compresses well; bodies are decompressed while streaming
         }
+        # Reuse one HTTP session so connections to the same host are kept alive
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Retry transient connection failures with a short backoff
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.3))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._source_lang_votes = {}  # First detected languages per source
+        self._source_lang_mode = {}  # Settled language per source
         self.db_name = "news.db"  # SQLite database file name
+        self.conn = self._connect()  # Shared SQLite connection
         self._init_db()  # Create DB table if not exists
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Release the pooled HTTP connections and the SQLite connection"""
+        self.session.close()
+        self.conn.close()
+
+    def _connect(self):
+        """Open the SQLite database and apply the write-tuning PRAGMAs"""
+        # Autocommit mode: transactions are opened explicitly with BEGIN where batching matters
+        conn = sqlite3.connect(self.db_name, isolation_level=None, check_same_thread=False)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
     def _init_db(self):
         """Initialize SQLite database and create the articles table if it doesn't exist"""
-        conn = sqlite3.connect(self.db_name)
+        conn = self.conn
         cursor = conn.cursor()
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS news_articles (
@@ -38,172 +187,297 @@ class NewsScraper:
             )
         ''')
         conn.commit()
-        conn.close()
-
-    def _store_in_db(self, entries):
-        """Store parsed entries into the SQLite database"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-
-        # Count number of articles per country to store in the NoofArticles field
-        country_counts = {}
-        for entry in entries:
-            country = entry["Country"]
-            country_counts[country] = country_counts.get(country, 0) + 1
 
-        # Insert each article into the DB
-        for entry in entries:
-            try:
-                cursor.execute('''
-                    INSERT OR IGNORE INTO news_articles 
-                    (Title, Summary, Published, Link, Source, Country, Language, NoofArticles)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    entry["Title"],
-                    entry["Summary"],
-                    entry["Published"],
-                    entry["Link"],
-                    entry["Source"],
-                    entry["Country"],
-                    entry["Language"],
-                    country_counts[entry["Country"]]
-                ))
-            except sqlite3.Error as e:
-                print(f"SQLite error for {entry['Link']}: {e}")
-        conn.commit()
-        conn.close()
+    def _store_in_db(self, df):
+        """Store the deduplicated articles DataFrame into the SQLite database"""
+        conn = self.conn
 
-    def is_url_accessible(self, url):
-        """Check if a given URL is accessible (status 200)"""
+        # Zip the columns in INSERT order into row tuples. executemany consumes them
+        # lazily, so rows are built in one pass without copying the DataFrame
+        rows = zip(*(df[column] for column in [
+            "Title", "Summary", "Published", "Link", "Source",
+            "Country", "Language", "NoOfArticles"
+        ]))
+        # INSERT OR IGNORE lets SQLite skip links already stored (Link is UNIQUE),
+        # so the only errors left are real failures, handled once for the batch.
+        # BEGIN is inside the try so a locked database is reported the same way
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            return response.status_code == 200
-        except requests.RequestException:
-            return False
+            conn.execute("BEGIN")
+            conn.executemany('''
+                INSERT OR IGNORE INTO news_articles 
+                (Title, Summary, Published, Link, Source, Country, Language, NoofArticles)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            conn.commit()
+        except sqlite3.DatabaseError as e:
+            conn.rollback()
+            print(f"SQLite error while storing {len(df)} entries, batch rolled back: {e}")
 
     def clean_summary(self, summary):
         """Strip HTML tags from summary content"""
-        soup = BeautifulSoup(summary, "html.parser")
-        text = soup.get_text(separator=" ", strip=True)
-        return html.unescape(text)
+        if not summary:
+            return ""
+        if LexborHTMLParser is not None:
+            text = LexborHTMLParser(summary).text(separator=" ", strip=True)
+        else:
+            text = _WS_RE.sub(" ", _TAG_RE.sub(" ", summary))
+        return html.unescape(text).strip()
+
+    def _learn_source_lang(self, source, language):
+        """Settle a source's language once its first detections all agree"""
+        votes = self._source_lang_votes.setdefault(source, [])
+        if len(votes) < LANG_MODE_SAMPLES:
+            votes.append(language)
+            if len(votes) == LANG_MODE_SAMPLES and language != "unknown" and len(set(votes)) == 1:
+                self._source_lang_mode[source] = language
+
+    def _find_tag(self, item, paths):
+        """Return the first element below item matching one of the given search paths"""
+        for path in paths:
+            tag = item.find(path)
+            if tag is not None:
+                return tag
+        return None
+
+    def _tag_text(self, tag):
+        """Return all text inside an XML element, or an empty string if it is missing"""
+        return "".join(tag.itertext()) if tag is not None else ""
 
     def parse_feed(self, feed):
-        """Parse an individual RSS feed and return a list of article entries"""
-        entries = []
+        """Fetch and parse an individual RSS feed and return a list of article entries"""
+        return list(self.iter_feed(feed))
 
-        # Skip feeds that are not accessible
-        if not self.is_url_accessible(feed["url"]):
-            print(f"Network error: Cannot access {feed['url']}")
-            return entries
+    def iter_feed(self, feed):
+        """Fetch an individual RSS feed and yield its article entries as they are parsed"""
+        # Skip feeds that are not accessible; stream the body so oversized feeds are abandoned
+        # early, before any download at all when the server announces the size
+        try:
+            with self.session.get(feed["url"], stream=True, timeout=(5, 15)) as response:
+                response.raise_for_status()
+                length = response.headers.get("Content-Length", "")
+                if length.isdigit() and int(length) > MAX_FEED_BYTES:
+                    print(f"Feed too large: {feed['url']} exceeds {MAX_FEED_BYTES} bytes, skipping")
+                    return
+                content = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    content.extend(chunk)
+                    if len(content) > MAX_FEED_BYTES:
+                        print(f"Feed too large: {feed['url']} exceeds {MAX_FEED_BYTES} bytes, skipping")
+                        return
+        except requests.RequestException as e:
+            print(f"Network error: Cannot access {feed['url']} ({type(e).__name__}: {e})")
+            return
+
+        yield from self._iter_entries(feed, bytes(content))
 
+    def _iter_entries(self, feed, content):
+        """Parse the raw RSS/Atom XML of a feed, yielding each article entry as soon as it is read"""
         try:
-            # Fetch and parse RSS XML
-            response = requests.get(feed["url"], headers=self.headers)
-            soup = BeautifulSoup(response.content, features="xml")
-            items = soup.find_all("item") or soup.find_all("entry")
+            # Stream the RSS/Atom XML with lxml, handling each item as soon as it is
+            # complete and tolerating the small syntax errors real feeds contain;
+            # "{*}" matches a tag in any namespace
+            items = etree.iterparse(io.BytesIO(content), events=("end",), tag=("{*}item", "{*}entry"),
+                                    recover=True, huge_tree=False)
+
+            # Bind per-article helpers and per-feed values to locals once, outside the loop
+            find_tag, tag_text, clean_summary = self._find_tag, self._tag_text, self.clean_summary
+            title_paths, summary_paths = self._TITLE_PATHS, self._SUMMARY_PATHS
+            pub_date_paths, link_paths = self._PUB_DATE_PATHS, self._LINK_PATHS
+            source, country, declared_lang = feed["source"], feed["country"], feed.get("lang")
+            source_lang_mode = self._source_lang_mode
 
-            for item in items:
+            for _, item in items:
                 # Extract article fields
-                title_tag = item.find("title")
-                summary_tag = item.find("description") or item.find("summary") or item.find("content")
-                pub_date_tag = item.find("pubDate") or item.find("updated")
-                link_tag = item.find("link")
+                title_tag = find_tag(item, title_paths)
+                summary_tag = find_tag(item, summary_paths)
+                pub_date_tag = find_tag(item, pub_date_paths)
+                link_tag = find_tag(item, link_paths)
 
                 # Get actual link text depending on format
-                link = link_tag["href"] if link_tag and link_tag.has_attr("href") else link_tag.text.strip() if link_tag else ""
-                title = title_tag.text.strip() if title_tag else ""
-                summary = self.clean_summary(summary_tag.text) if summary_tag else ""
-                published = pub_date_tag.text.strip() if pub_date_tag else ""
-
-                # Detect language of article
-                text_for_lang = f"{title} {summary}".strip()
-                try:
-                    language = detect(text_for_lang) if text_for_lang else "unknown"
-                except:
-                    language = "unknown"
+                link = link_tag.get("href") or tag_text(link_tag).strip() if link_tag is not None else ""
+                title = tag_text(title_tag).strip()
+                summary = clean_summary(tag_text(summary_tag)) if summary_tag is not None else ""
+                published = tag_text(pub_date_tag).strip()
+
+                # Use the feed's declared (or already settled) language; otherwise detect
+                # it from a short prefix of the article so repeats hit the cache
+                language = declared_lang or source_lang_mode.get(source)
+                if not language:
+                    text_for_lang = f"{title[:64]} {summary[:128]}".strip()
+                    language = _detect_cached(text_for_lang) if text_for_lang else "unknown"
+                    self._learn_source_lang(source, language)
 
                 # Only add if essential fields exist
                 if title and link:
-                    entries.append({
+                    yield {
                         "Title": title,
                         "Summary": summary,
                         "Published": published,
                         "Link": link,
-                        "Source": feed["source"],
-                        "Country": feed["country"],
+                        "Source": source,
+                        "Country": country,
                         "Language": language
-                    })
+                    }
+
+                # Free the processed item and any siblings already handled so
+                # memory stays flat however long the feed is
+                item.clear()
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
+
+            if items.root is None:
+                print(f"Error parsing feed {feed['url']}: not an XML document")
 
         except Exception as e:
             print(f"Error parsing feed {feed['url']}: {e}")
-        return entries
+
+    async def _fetch(self, session, feed):
+        """Download the raw content of a single RSS feed, or None if it exceeds MAX_FEED_BYTES"""
+        timeout = aiohttp.ClientTimeout(total=15)
+        async with session.get(feed["url"], headers=self.headers, timeout=timeout) as response:
+            response.raise_for_status()
+            if (response.content_length or 0) > MAX_FEED_BYTES:
+                print(f"Feed too large: {feed['url']} exceeds {MAX_FEED_BYTES} bytes, skipping")
+                return None
+            content = bytearray()
+            async for chunk in response.content.iter_chunked(65536):
+                content.extend(chunk)
+                if len(content) > MAX_FEED_BYTES:
+                    print(f"Feed too large: {feed['url']} exceeds {MAX_FEED_BYTES} bytes, skipping")
+                    return None
+            return bytes(content)
+
+    async def _fetch_and_parse(self, session, feed):
+        """Download a single RSS feed and parse it on a worker thread, or None if it was skipped"""
+        content = await self._fetch(session, feed)
+        if content is None:
+            return None
+        # Parsing is CPU-bound, so keep it off the event loop while other downloads continue
+        return await asyncio.get_running_loop().run_in_executor(None, list, self._iter_entries(feed, content))
+
+    async def _fetch_all_feeds(self):
+        """Download and parse all configured RSS feeds concurrently over one shared session"""
+        # Limit connections per host too, so feeds sharing a server don't hog the pool
+        connector = aiohttp.TCPConnector(limit=32, limit_per_host=4, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Failed downloads are returned as exceptions instead of cancelling the rest
+            return await asyncio.gather(
+                *[self._fetch_and_parse(session, feed) for feed in self.rss_feeds],
+                return_exceptions=True
+            )
+
+    def _scrape_all_feeds_threaded(self):
+        """Fetch and parse all configured RSS feeds on a thread pool sharing one requests.Session"""
+        all_entries = []
+        seen = set()  # (Title, Link) of every entry kept so far
+        # Blocking socket reads release the GIL, so threads overlap the downloads.
+        # map yields results in configuration order, so the output does not depend on timing
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            for feed, feed_entries in zip(self.rss_feeds, executor.map(self.parse_feed, self.rss_feeds)):
+                print(f"Processing {feed['country']} - {feed['source']}")
+                added = len(all_entries)
+                all_entries.extend(self._iter_unique(feed_entries, seen))
+                print(f"  - Added {len(all_entries) - added} entries")
+        return all_entries
 
     def scrape_all_feeds(self):
-        """Scrape and parse all configured RSS feeds"""
+        """Download and parse all configured RSS feeds concurrently"""
+        if aiohttp is None:
+            return self._scrape_all_feeds_threaded()
+
         all_entries = []
-        for feed in self.rss_feeds:
+        seen = set()  # (Title, Link) of every entry kept so far
+        results = asyncio.run(self._fetch_all_feeds())
+        for feed, result in zip(self.rss_feeds, results):
             print(f"Processing {feed['country']} - {feed['source']}")
-            feed_entries = self.parse_feed(feed)
-            all_entries.extend(feed_entries)
-            print(f"  - Added {len(feed_entries)} entries")
+            if isinstance(result, BaseException):
+                print(f"Network error: Cannot access {feed['url']} ({type(result).__name__}: {result})")
+                continue
+            if result is None:
+                continue
+            added = len(all_entries)
+            all_entries.extend(self._iter_unique(result, seen))
+            print(f"  - Added {len(all_entries) - added} entries")
         return all_entries
 
     def remove_duplicates(self, entries):
-        """Remove duplicate articles based on Title and Link"""
-        df = pd.DataFrame(entries)
-        df.drop_duplicates(subset=["Title", "Link"], inplace=True)
-        return df
+        """Remove duplicate articles based on Title and Link, keeping the first one"""
+        return list(self._iter_unique(entries, set()))
+
+    def _iter_unique(self, entries, seen):
+        """Yield the entries whose (Title, Link) is not in seen yet, adding their keys to it"""
+        for entry in entries:
+            key = (entry["Title"], entry["Link"])
+            if key not in seen:
+                seen.add(key)
+                yield entry
 
     def save_to_csv(self, df, filename="news_data.csv"):
-        """Save article data to a CSV file with country-wise article count"""
-        country_counts = df['Country'].value_counts().to_dict()
-        df['NoOfArticles'] = df['Country'].map(country_counts)
-        df.to_csv(filename, index=False, encoding="utf-8")
+        """Save article data, including the country-wise article count, to a CSV file"""
+        if pa is not None:
+            # pyarrow's C++ writer converts and writes whole columns at a time. It has no
+            # minimal quoting mode: "needed" quotes every string and leaves numbers bare,
+            # which the csv.writer fallback below matches with QUOTE_NONNUMERIC
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), filename,
+                             write_options=pa_csv.WriteOptions(quoting_style="needed"))
+            print(f"Saved news data to {filename}")
+            return
+        # Otherwise plain csv.writer avoids pandas' per-cell formatting overhead
+        with open(filename, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh, lineterminator="\n", quoting=csv.QUOTE_NONNUMERIC)
+            writer.writerow(df.columns)
+            writer.writerows(df.itertuples(index=False, name=None))
         print(f"Saved news data to {filename}")
 
     def run(self):
         """Main method to execute the scraping, saving, and storing"""
         print(f"Job started at {datetime.now()}")
         
-        # Scrape and parse all feeds
+        # Scrape and parse all feeds; duplicates are dropped as each feed is merged
         entries = self.scrape_all_feeds()
 
-        # Remove duplicates
-        df_cleaned = self.remove_duplicates(entries)
+        # Build the DataFrame once and count articles per country for both the DB and the CSV;
+        # fixed columns keep the groupby valid even when no feed returned any entries
+        df_cleaned = pd.DataFrame(entries, columns=ARTICLE_COLUMNS)
+        df_cleaned["NoOfArticles"] = df_cleaned.groupby("Country")["Country"].transform("size")
         
         # Store in SQLite database
-        self._store_in_db(df_cleaned.to_dict("records"))
+        self._store_in_db(df_cleaned)
         print(f"Stored {len(df_cleaned)} entries in SQLite DB: {self.db_name}")
         
         # Save to CSV file
         self.save_to_csv(df_cleaned)
+
+        # Release the HTTP pool and the database connection
+        self.close()
         print(f"Job finished at {datetime.now()}\n")
 
-# Configuration of 20 different country news RSS feeds
+# Configuration of 20 different country news RSS feeds.
+# "lang" declares a single-language feed and skips language detection for it
 RSS_FEEDS = [
-    {"country": "UK", "source": "BBC", "url": "http://feeds.bbci.co.uk/news/rss.xml"},
-    {"country": "US", "source": "CNN", "url": "http://rss.cnn.com/rss/edition.rss"},
-    {"country": "Canada", "source": "CBC", "url": "https://rss.cbc.ca/lineup/topstories.xml"},
-    {"country": "Australia", "source": "ABC", "url": "https://www.abc.net.au/news/feed/51120/rss.xml"},
-    {"country": "India", "source": "NDTV", "url": "https://feeds.feedburner.com/ndtvnews-top-stories"},
-    {"country": "Germany", "source": "Deutsche Welle", "url": "https://rss.dw.com/rdf/rss-en-all"},
-    {"country": "France", "source": "France 24", "url": "https://www.france24.com/en/rss"},
-    {"country": "Japan", "source": "NHK", "url": "https://www3.nhk.or.jp/rss/news/cat0.xml"},
-    {"country": "China", "source": "China Daily", "url": "http://www.chinadaily.com.cn/rss/china_rss.xml"},
-    {"country": "Russia", "source": "RT News", "url": "https://www.rt.com/rss/news/"},
-    {"country": "Brazil", "source": "G1 Globo", "url": "https://g1.globo.com/rss/g1/"},
-    {"country": "South Africa", "source": "News24", "url": "https://feeds.news24.com/articles/news24/TopStories/rss"},
-    {"country": "Italy", "source": "ANSA", "url": "https://www.ansa.it/sito/ansait_rss.xml"},
-    {"country": "Spain", "source": "El Pais", "url": "https://feeds.elpais.com/mrss-s/pages/ep/site/elpais.com/portada"},
-    {"country": "Mexico", "source": "Excelsior", "url": "https://www.excelsior.com.mx/rss.xml"},
-    {"country": "Turkey", "source": "Daily Sabah", "url": "https://www.dailysabah.com/rss/turkey"},
-    {"country": "South Korea", "source": "Korea.net", "url": "https://www.korea.net/koreanet/rss/news/3"},
-    {"country": "New Zealand", "source": "RNZ National", "url": "https://www.rnz.co.nz/rss/national.xml"},
-    {"country": "Singapore", "source": "CNA", "url": "https://www.channelnewsasia.com/rssfeeds/8395986"},
-    {"country": "Nigeria", "source": "Daily Post Nigeria", "url": "https://dailypost.ng/feed/"},
+    {"country": "UK", "source": "BBC", "url": "http://feeds.bbci.co.uk/news/rss.xml", "lang": "en"},
+    {"country": "US", "source": "CNN", "url": "http://rss.cnn.com/rss/edition.rss", "lang": "en"},
+    {"country": "Canada", "source": "CBC", "url": "https://rss.cbc.ca/lineup/topstories.xml", "lang": "en"},
+    {"country": "Australia", "source": "ABC", "url": "https://www.abc.net.au/news/feed/51120/rss.xml", "lang": "en"},
+    {"country": "India", "source": "NDTV", "url": "https://feeds.feedburner.com/ndtvnews-top-stories", "lang": "en"},
+    {"country": "Germany", "source": "Deutsche Welle", "url": "https://rss.dw.com/rdf/rss-en-all", "lang": "en"},
+    {"country": "France", "source": "France 24", "url": "https://www.france24.com/en/rss", "lang": "en"},
+    {"country": "Japan", "source": "NHK", "url": "https://www3.nhk.or.jp/rss/news/cat0.xml", "lang": "ja"},
+    {"country": "China", "source": "China Daily", "url": "http://www.chinadaily.com.cn/rss/china_rss.xml", "lang": "en"},
+    {"country": "Russia", "source": "RT News", "url": "https://www.rt.com/rss/news/", "lang": "en"},
+    {"country": "Brazil", "source": "G1 Globo", "url": "https://g1.globo.com/rss/g1/", "lang": "pt"},
+    {"country": "South Africa", "source": "News24", "url": "https://feeds.news24.com/articles/news24/TopStories/rss", "lang": "en"},
+    {"country": "Italy", "source": "ANSA", "url": "https://www.ansa.it/sito/ansait_rss.xml", "lang": "it"},
+    {"country": "Spain", "source": "El Pais", "url": "https://feeds.elpais.com/mrss-s/pages/ep/site/elpais.com/portada", "lang": "es"},
+    {"country": "Mexico", "source": "Excelsior", "url": "https://www.excelsior.com.mx/rss.xml", "lang": "es"},
+    {"country": "Turkey", "source": "Daily Sabah", "url": "https://www.dailysabah.com/rss/turkey", "lang": "en"},
+    {"country": "South Korea", "source": "Korea.net", "url": "https://www.korea.net/koreanet/rss/news/3", "lang": "en"},
+    {"country": "New Zealand", "source": "RNZ National", "url": "https://www.rnz.co.nz/rss/national.xml", "lang": "en"},
+    {"country": "Singapore", "source": "CNA", "url": "https://www.channelnewsasia.com/rssfeeds/8395986", "lang": "en"},
+    {"country": "Nigeria", "source": "Daily Post Nigeria", "url": "https://dailypost.ng/feed/", "lang": "en"},
 ]
 
 # Run scraper if this script is executed directly
 if __name__ == "__main__":
-    scraper = NewsScraper(RSS_FEEDS)
-    scraper.run()
+    with NewsScraper(RSS_FEEDS) as scraper:
+        scraper.run()